@@ -318,10 +318,8 @@ def eig(A, dt=None):
     """
     if dt is None:
         dt = impl.get_runtime().default_fp
-    from taichi.lang import linalg
-    if A.n == 2:
-        return linalg.eig2x2(A, dt)
-    raise Exception("Eigen solver only supports 2D matrices.")
+    from .linalg import eig
+    return eig(A, dt)
 
 
 def sym_eig(A, dt=None):
@@ -341,13 +339,10 @@ def sym_eig(A, dt=None):
     eigenvectors: ti.Matrix(n, n)
         The eigenvectors. Each column stores one eigenvector.
     """
-    assert all(A == A.transpose()), "A needs to be symmetric"
     if dt is None:
         dt = impl.get_runtime().default_fp
-    from taichi.lang import linalg
-    if A.n == 2:
-        return linalg.sym_eig2x2(A, dt)
-    raise Exception("Symmetric eigen solver only supports 2D matrices.")
+    from .linalg import sym_eig
+    return sym_eig(A, dt)
 
 
 def randn(dt=None):
@@ -357,6 +352,13 @@ def randn(dt=None):
     return randn(dt)
 
 
+def randn_pair(dt=None):
+    if dt is None:
+        dt = impl.get_runtime().default_fp
+    from .random import randn_pair
+    return randn_pair(dt)
+
+
 determinant = deprecated('ti.determinant(a)',
                          'a.determinant()')(Matrix.determinant)
 tr = deprecated('ti.tr(a)', 'a.trace()')(Matrix.trace)
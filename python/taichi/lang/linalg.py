@@ -1,5 +1,6 @@
 from taichi.core.util import ti_core as _ti_core
-from taichi.lang.impl import expr_init
+from taichi.lang.expr import Expr
+from taichi.lang.impl import current_cfg
 
 import taichi as ti
 
@@ -7,7 +8,7 @@ import taichi as ti
 @ti.func
 def polar_decompose2d(a, dt):
     x, y = a(0, 0) + a(1, 1), a(1, 0) - a(0, 1)
-    scale = (1.0 / ti.sqrt(x * x + y * y))
+    scale = ti.rsqrt(ti.cast(x * x + y * y, dt))
     c = x * scale
     s = y * scale
     r = ti.Matrix([[c, -s], [s, c]])
@@ -24,38 +25,36 @@ def polar_decompose3d(A, dt):
 @ti.func
 def svd2d(A, dt):
     R, S = polar_decompose2d(A, dt)
-    c, s = ti.cast(0.0, dt), ti.cast(0.0, dt)
-    s1, s2 = ti.cast(0.0, dt), ti.cast(0.0, dt)
+    zero = ti.cast(0.0, dt)
+    c, s = zero, zero
+    s1, s2 = zero, zero
     if abs(S[0, 1]) < 1e-5:
         c, s = 1, 0
         s1, s2 = S[0, 0], S[1, 1]
     else:
         tao = ti.cast(0.5, dt) * (S[0, 0] - S[1, 1])
         w = ti.sqrt(tao**2 + S[0, 1]**2)
-        t = ti.cast(0.0, dt)
+        t = zero
         if tao > 0:
             t = S[0, 1] / (tao + w)
         else:
             t = S[0, 1] / (tao - w)
-        c = 1 / ti.sqrt(t**2 + 1)
+        c = ti.rsqrt(t**2 + 1)
         s = -t * c
         s1 = c**2 * S[0, 0] - 2 * c * s * S[0, 1] + s**2 * S[1, 1]
         s2 = s**2 * S[0, 0] + 2 * c * s * S[0, 1] + c**2 * S[1, 1]
-    V = ti.Matrix.zero(dt, 2, 2)
-    if s1 < s2:
-        tmp = s1
-        s1 = s2
-        s2 = tmp
-        V = [[-s, c], [-c, -s]]
-    else:
-        V = [[c, s], [-s, c]]
+    # Order the singular values without branching
+    swap = s1 < s2
+    V = ti.Matrix([[ti.select(swap, -s, c), ti.select(swap, c, s)],
+                   [ti.select(swap, -c, -s), ti.select(swap, -s, c)]])
+    s1, s2 = ti.select(swap, s2, s1), ti.select(swap, s1, s2)
     U = R @ V
-    return U, ti.Matrix([[s1, ti.cast(0, dt)], [ti.cast(0, dt), s2]]), V
+    return U, ti.Matrix([[s1, zero], [zero, s2]]), V
 
 
 def svd3d(A, dt, iters=None):
     assert A.n == 3 and A.m == 3
-    inputs = tuple([e.ptr for e in A.entries])
+    inputs = tuple([Expr(e).ptr for e in A.entries])
     assert dt in [ti.f32, ti.f64]
     if iters is None:
         if dt == ti.f32:
@@ -67,17 +66,14 @@ def svd3d(A, dt, iters=None):
     else:
         rets = _ti_core.sifakis_svd_f64(*inputs, iters)
     assert len(rets) == 21
-    U_entries = rets[:9]
-    V_entries = rets[9:18]
-    sig_entries = rets[18:]
-    U = expr_init(ti.Matrix.zero(dt, 3, 3))
-    V = expr_init(ti.Matrix.zero(dt, 3, 3))
-    sigma = expr_init(ti.Matrix.zero(dt, 3, 3))
-    for i in range(3):
-        for j in range(3):
-            U(i, j).assign(U_entries[i * 3 + j])
-            V(i, j).assign(V_entries[i * 3 + j])
-        sigma(i, i).assign(sig_entries[i])
+    # The builder returns its local variables, so wrap them directly instead
+    # of copying them into freshly zeroed matrices.
+    rets = [Expr(e) for e in rets]
+    zero = ti.cast(0, dt)
+    U = ti.Matrix([rets[i * 3:i * 3 + 3] for i in range(3)])
+    V = ti.Matrix([rets[9 + i * 3:9 + i * 3 + 3] for i in range(3)])
+    sigma = ti.Matrix([[rets[18], zero, zero], [zero, rets[19], zero],
+                       [zero, zero, rets[20]]])
     return U, sigma, V
 
 
@@ -86,83 +82,100 @@ def eig2x2(A, dt):
     tr = A.trace()
     det = A.determinant()
     gap = tr**2 - 4 * det
+    I2 = ti.Matrix.identity(dt, 2)
     lambda1 = ti.Vector.zero(dt, 2)
     lambda2 = ti.Vector.zero(dt, 2)
     v1 = ti.Vector.zero(dt, 4)
     v2 = ti.Vector.zero(dt, 4)
+    sq = ti.sqrt(abs(gap))
     if gap > 0:
-        lambda1 = ti.Vector([tr + ti.sqrt(gap), ti.cast(0.0, dt)]) * 0.5
-        lambda2 = ti.Vector([tr - ti.sqrt(gap), ti.cast(0.0, dt)]) * 0.5
-        A1 = A - lambda1[0] * ti.Matrix.identity(dt, 2)
-        A2 = A - lambda2[0] * ti.Matrix.identity(dt, 2)
+        lambda1 = ti.Vector([tr + sq, ti.cast(0.0, dt)]) * 0.5
+        lambda2 = ti.Vector([tr - sq, ti.cast(0.0, dt)]) * 0.5
+        A1 = A - lambda1[0] * I2
+        A2 = A - lambda2[0] * I2
         if all(A1 == ti.Matrix.zero(dt, 2, 2)) and all(
                 A1 == ti.Matrix.zero(dt, 2, 2)):
             v1 = ti.Vector([0.0, 0.0, 1.0, 0.0]).cast(dt)
             v2 = ti.Vector([1.0, 0.0, 0.0, 0.0]).cast(dt)
         else:
-            v1 = ti.Vector([A2[0, 0], 0.0, A2[1, 0],
-                            0.0]).cast(dt).normalized()
-            v2 = ti.Vector([A1[0, 0], 0.0, A1[1, 0],
-                            0.0]).cast(dt).normalized()
+            v1 = ti.Vector([A2[0, 0], 0.0, A2[1, 0], 0.0]).cast(dt)
+            v2 = ti.Vector([A1[0, 0], 0.0, A1[1, 0], 0.0]).cast(dt)
+            v1 = v1 * v1.norm_inv()
+            v2 = v2 * v2.norm_inv()
     else:
-        lambda1 = ti.Vector([tr, ti.sqrt(-gap)]) * 0.5
-        lambda2 = ti.Vector([tr, -ti.sqrt(-gap)]) * 0.5
-        A1r = A - lambda1[0] * ti.Matrix.identity(dt, 2)
-        A1i = -lambda1[1] * ti.Matrix.identity(dt, 2)
-        A2r = A - lambda2[0] * ti.Matrix.identity(dt, 2)
-        A2i = -lambda2[1] * ti.Matrix.identity(dt, 2)
+        lambda1 = ti.Vector([tr, sq]) * 0.5
+        lambda2 = ti.Vector([tr, -sq]) * 0.5
+        A1r = A - lambda1[0] * I2
+        A1i = -lambda1[1] * I2
+        A2r = A - lambda2[0] * I2
+        A2i = -lambda2[1] * I2
         v1 = ti.Vector([A2r[0, 0], A2i[0, 0], A2r[1, 0],
-                        A2i[1, 0]]).cast(dt).normalized()
+                        A2i[1, 0]]).cast(dt)
         v2 = ti.Vector([A1r[0, 0], A1i[0, 0], A1r[1, 0],
-                        A1i[1, 0]]).cast(dt).normalized()
-    eigenvalues = ti.Matrix.rows([lambda1, lambda2])
-    eigenvectors = ti.Matrix.cols([v1, v2])
+                        A1i[1, 0]]).cast(dt)
+        v1 = v1 * v1.norm_inv()
+        v2 = v2 * v2.norm_inv()
+    eigenvalues = ti.Matrix([[lambda1[0], lambda1[1]],
+                             [lambda2[0], lambda2[1]]])
+    eigenvectors = ti.Matrix([[v1[0], v2[0]], [v1[1], v2[1]], [v1[2], v2[2]],
+                              [v1[3], v2[3]]])
 
     return eigenvalues, eigenvectors
 
 
 @ti.func
 def sym_eig2x2(A, dt):
-    tr = A.trace()
-    det = A.determinant()
-    gap = tr**2 - 4 * det
-    lambda1 = (tr + ti.sqrt(gap)) * 0.5
-    lambda2 = (tr - ti.sqrt(gap)) * 0.5
-    eigenvalues = ti.Vector([lambda1, lambda2]).cast(dt)
-
-    A1 = A - lambda1 * ti.Matrix.identity(dt, 2)
-    A2 = A - lambda2 * ti.Matrix.identity(dt, 2)
-    v1 = ti.Vector.zero(dt, 2)
-    v2 = ti.Vector.zero(dt, 2)
-    if all(A1 == ti.Matrix.zero(dt, 2, 2)) and all(
-            A1 == ti.Matrix.zero(dt, 2, 2)):
-        v1 = ti.Vector([0.0, 1.0]).cast(dt)
-        v2 = ti.Vector([1.0, 0.0]).cast(dt)
-    else:
-        v1 = ti.Vector([A2[0, 0], A2[1, 0]]).cast(dt).normalized()
-        v2 = ti.Vector([A1[0, 0], A1[1, 0]]).cast(dt).normalized()
-    eigenvectors = ti.Matrix.cols([v1, v2])
+    if ti.static(current_cfg().debug):
+        assert all(A == A.transpose()), "A needs to be symmetric"
+    a = ti.cast(A[0, 0], dt)
+    b = ti.cast(A[0, 1], dt)
+    d = ti.cast(A[1, 1], dt)
+    half = ti.cast(0.5, dt)
+    tau = half * (a - d)
+    w = ti.sqrt(tau**2 + b**2)
+    # Jacobi rotation as in svd2d: t = tan(theta) of the smaller angle
+    # that diagonalizes A, so (c, s) and (-s, c) are the eigenvectors
+    t = ti.cast(0.0, dt)
+    if w > 0:
+        t = b / (tau + ti.select(tau >= 0, w, -w))
+    c = ti.rsqrt(t**2 + 1)
+    s = t * c
+    # (c, s) belongs to the larger eigenvalue unless tau < 0
+    swap = tau < 0
+    eigenvalues = ti.Vector([half * (a + d) + w, half * (a + d) - w])
+    eigenvectors = ti.Matrix([[ti.select(swap, -s, c),
+                               ti.select(swap, c, -s)],
+                              [ti.select(swap, c, s),
+                               ti.select(swap, s, c)]])
     return eigenvalues, eigenvectors
 
 
-@ti.func
+_svd_funcs = {2: svd2d, 3: svd3d}
+_polar_decompose_funcs = {2: polar_decompose2d, 3: polar_decompose3d}
+_eig_funcs = {2: eig2x2}
+_sym_eig_funcs = {2: sym_eig2x2}
+
+
 def svd(A, dt):
-    if ti.static(A.n == 2):
-        ret = svd2d(A, dt)
-        return ret
-    elif ti.static(A.n == 3):
-        return svd3d(A, dt)
-    else:
+    if A.n not in _svd_funcs:
         raise Exception("SVD only supports 2D and 3D matrices.")
+    return _svd_funcs[A.n](A, dt)
 
 
-@ti.func
 def polar_decompose(A, dt):
-    if ti.static(A.n == 2):
-        ret = polar_decompose2d(A, dt)
-        return ret
-    elif ti.static(A.n == 3):
-        return polar_decompose3d(A, dt)
-    else:
+    if A.n not in _polar_decompose_funcs:
         raise Exception(
             "Polar decomposition only supports 2D and 3D matrices.")
+    return _polar_decompose_funcs[A.n](A, dt)
+
+
+def eig(A, dt):
+    if A.n not in _eig_funcs:
+        raise Exception("Eigen solver only supports 2D matrices.")
+    return _eig_funcs[A.n](A, dt)
+
+
+def sym_eig(A, dt):
+    if A.n not in _sym_eig_funcs:
+        raise Exception("Symmetric eigen solver only supports 2D matrices.")
+    return _sym_eig_funcs[A.n](A, dt)
@@ -79,16 +79,16 @@ def _test_eig2x2_complex(dt):
     _eigen_vector_equal(w_ti_complex[:, idx_ti[1]], w_np[:, idx_np[1]], tol)
 
 
-def _test_sym_eig2x2(dt):
+def _test_sym_eig2x2(dt, a):
     A = ti.Matrix.field(2, 2, dtype=dt, shape=())
     v = ti.Vector.field(2, dtype=dt, shape=())
     w = ti.Matrix.field(2, 2, dtype=dt, shape=())
 
-    A[None] = [[5, 3], [3, 2]]
+    A[None] = a
 
     @ti.kernel
     def eigen_solve():
-        v[None], w[None] = ti.sym_eig(A[None])
+        v[None], w[None] = ti.sym_eig(A[None], dt)
 
     tol = 1e-5 if dt == ti.f32 else 1e-12
     dtype = np.float32 if dt == ti.f32 else np.float64
@@ -119,11 +119,47 @@ def test_eig2x2():
 
 
 def test_sym_eig2x2():
-    for func in [_test_sym_eig2x2]:
-        for fp in [ti.f32, ti.f64]:
+    for a in [[[5, 3], [3, 2]], [[1, 0], [0, 3]], [[-1, 4], [4, 1]]]:
+        # The last pair requests results in a dtype other than default_fp
+        for fp, dt in [(ti.f32, ti.f32), (ti.f64, ti.f64), (ti.f64, ti.f32)]:
 
             @ti.all_archs_with(default_fp=fp, fast_math=False)
             def wrapped():
-                func(fp)
+                _test_sym_eig2x2(dt, a)
 
             wrapped()
+
+
+@ti.all_archs
+def test_sym_eig2x2_integer():
+    v = ti.Vector.field(2, dtype=ti.f32, shape=())
+    w = ti.Matrix.field(2, 2, dtype=ti.f32, shape=())
+
+    @ti.kernel
+    def eigen_solve():
+        v[None], w[None] = ti.sym_eig(ti.Matrix([[2, 1], [1, 2]]))
+
+    eigen_solve()
+    np.testing.assert_allclose(v.to_numpy(), [3, 1], atol=1e-5, rtol=1e-5)
+    w_ti = w.to_numpy()
+    _eigen_vector_equal(w_ti[:, 0], np.array([1, 1]), 1e-5)
+    _eigen_vector_equal(w_ti[:, 1], np.array([1, -1]), 1e-5)
+
+
+@ti.require(ti.extension.assertion)
+@ti.all_archs_with(debug=True, gdb_trigger=False)
+def test_sym_eig2x2_asymmetric():
+    A = ti.Matrix.field(2, 2, dtype=ti.f32, shape=())
+    v = ti.Vector.field(2, dtype=ti.f32, shape=())
+    w = ti.Matrix.field(2, 2, dtype=ti.f32, shape=())
+
+    @ti.kernel
+    def eigen_solve():
+        v[None], w[None] = ti.sym_eig(A[None])
+
+    A[None] = [[2, 1], [1, 2]]
+    eigen_solve()
+
+    A[None] = [[2, 1], [0, 2]]
+    with pytest.raises(RuntimeError):
+        eigen_solve()
@@ -171,3 +171,32 @@ def test_randn():
         moments = [0.0, 1.0, 0.0, 3.0]
         for i in range(4):
             assert (X**(i + 1)).mean() == approx(moments[i], abs=3e-2)
+
+
+@archs_support_random
+def test_randn_pair():
+    '''
+    Tests the generation of paired Gaussian random numbers.
+    '''
+    for precision in [ti.f32, ti.f64]:
+        ti.init()
+        n = 1024
+        x = ti.field(ti.f32, shape=(n, n))
+        y = ti.field(ti.f32, shape=(n, n))
+
+        @ti.kernel
+        def fill():
+            for i in range(n):
+                for j in range(n):
+                    x[i, j], y[i, j] = ti.randn_pair(precision)
+
+        fill()
+        X = x.to_numpy()
+        Y = y.to_numpy()
+
+        # https://en.wikipedia.org/wiki/Normal_distribution#Moments
+        moments = [0.0, 1.0, 0.0, 3.0]
+        for i in range(4):
+            assert (X**(i + 1)).mean() == approx(moments[i], abs=3e-2)
+            assert (Y**(i + 1)).mean() == approx(moments[i], abs=3e-2)
+        assert (X * Y).mean() == approx(0.0, abs=3e-2)
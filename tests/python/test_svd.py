@@ -1,3 +1,5 @@
+import itertools
+
 import taichi as ti
 import numpy as np
 from taichi import approx
@@ -85,3 +87,65 @@ def test_transpose_no_loop():
 
     run()
     # As long as it passes compilation we are good
+
+
+def _test_svd_soa(dt, n):
+    if n == 3:
+        base = np.array([[1, 1, 3], [9, -3, 2], [-3, 4, 2]])
+    else:
+        base = np.array([[1, 1], [2, 3]])
+    # Permuting and negating rows keeps A^T A, and thus the conditioning,
+    # of the well-tested base matrix
+    inputs = np.array([
+        np.diag(signs) @ base[list(perm)]
+        for perm in itertools.permutations(range(n))
+        for signs in itertools.product([1, -1], repeat=n)
+    ])
+    N = len(inputs)
+
+    A = ti.Matrix.field(n, n, dtype=dt)
+    A_reconstructed = ti.Matrix.field(n, n, dtype=dt)
+    for e in A.get_field_members() + A_reconstructed.get_field_members():
+        ti.root.dense(ti.i, N).place(e)
+
+    @ti.kernel
+    def run():
+        for p in A:
+            U, sigma, V = ti.svd(A[p], dt)
+            A_reconstructed[p] = U @ sigma @ V.transpose()
+
+    A.from_numpy(inputs.astype(np.float32 if dt == ti.f32 else np.float64))
+    run()
+
+    tol = 1e-5 if dt == ti.f32 else 1e-12
+    assert mat_equal(A_reconstructed.to_numpy(), A.to_numpy(), tol=tol)
+
+
+def test_svd_soa():
+    for fp in [ti.f32, ti.f64]:
+        for d in [2, 3]:
+
+            @ti.all_archs_with(default_fp=fp, fast_math=False)
+            def wrapped():
+                _test_svd_soa(fp, d)
+
+            wrapped()
+
+
+@ti.all_archs
+def test_svd_literal_matrix():
+    A2_reconstructed = ti.Matrix.field(2, 2, dtype=ti.f32, shape=())
+    A3_reconstructed = ti.Matrix.field(3, 3, dtype=ti.f32, shape=())
+
+    @ti.kernel
+    def run():
+        U2, sigma2, V2 = ti.svd(ti.Matrix([[1, 1], [2, 3]]))
+        A2_reconstructed[None] = U2 @ sigma2 @ V2.transpose()
+        U3, sigma3, V3 = ti.svd(ti.Matrix([[3, 0, 0], [0, 2, 0], [0, 0, 1]]))
+        A3_reconstructed[None] = U3 @ sigma3 @ V3.transpose()
+
+    run()
+    assert mat_equal(A2_reconstructed.to_numpy(),
+                     np.array([[1, 1], [2, 3]]),
+                     tol=1e-5)
+    assert mat_equal(A3_reconstructed.to_numpy(), np.diag([3, 2, 1]), tol=1e-5)